@@ -0,0 +1,302 @@
+"""Záťažový test: veľa súbežných používateľov proti bežiacemu serveru.
+
+Každý virtuálny používateľ sa prihlási cez /login (vlastná session) a opakuje
+realistický mix akcií s krátkou pauzou medzi nimi:
+
+    robotník – prepínanie týždňov na dashboarde (stránka + /api/dashboard/summary
+               ako v prehliadači), pridávanie záznamov s viacerými adresami
+               (add_record), nahrávanie dokumentov
+    admin    – dashboard celej firmy, PDF exporty cez frontu úloh (zadanie,
+               čakanie na dokončenie, stiahnutie), zoznam partií
+
+Na konci (a po každom stupni pri --stages) vypíše pre každú trasu počet
+požiadaviek, priepustnosť, latenciu p50 / p95 / p99 a podiel chýb. Stupňovaním
+súbežnosti sa dá nájsť bod, kde PDF exporty začnú brzdiť dashboard.
+
+Exporty berú náhodný týždeň alebo rozsah dátumov z celej histórie
+(--history-weeks), takže takmer vždy minú cache reportov a naozaj sa
+vykresľujú; zásahy cache sa vypíšu zvlášť („PDF job z cache“).
+
+    gunicorn -c gunicorn.conf.py app:app          # lokálne, nad lokálnym Postgresom
+    python benchmarks/load.py --workers 20 --admins 3 --duration 60
+    python benchmarks/load.py --stages 5 10 20 40 --admins 4 --duration 45 --json load.json
+
+Používatelia sú tí z benchmarks/seed.py (userNNNN@example.com / heslo123),
+admin je admin@example.com / admin123. Pozor: test naozaj zapisuje záznamy
+a nahráva súbory – púšťať len proti benchmarkovej databáze.
+"""
+import argparse
+import http.cookiejar
+import json
+import random
+import re
+import sys
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+import uuid
+from collections import defaultdict
+from datetime import date, timedelta
+
+
+EXPORT_POLL_S = 1.5  # ako static/js/export_jobs.js
+PROJECT_SELECT_RE = re.compile(r'<select name="project_id" class="form-select" required>(.*?)</select>', re.S)
+OPTION_RE = re.compile(r'<option value="(\d+)"')
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000")
+    parser.add_argument("--workers", type=int, default=20, help="súbežných robotníkov")
+    parser.add_argument("--admins", type=int, default=2, help="súbežných adminov")
+    parser.add_argument("--stages", type=int, nargs="*", help="počty robotníkov po stupňoch (prepíše --workers)")
+    parser.add_argument("--duration", type=float, default=60, help="sekúnd na stupeň")
+    parser.add_argument("--think", type=float, default=1.0, help="priemerná pauza medzi akciami (s)")
+    parser.add_argument("--user-count", type=int, default=200, help="koľko seed používateľov je k dispozícii")
+    parser.add_argument("--password", default="heslo123")
+    parser.add_argument("--admin-email", default="admin@example.com")
+    parser.add_argument("--admin-password", default="admin123")
+    parser.add_argument("--timeout", type=float, default=60)
+    parser.add_argument("--history-weeks", type=int, default=156, help="z koľkých týždňov dozadu vyberať exporty")
+    parser.add_argument("--export-wait", type=float, default=300, help="najdlhšie čakanie na PDF úlohu (s)")
+    parser.add_argument("--json", help="ulož výsledky aj do JSON súboru")
+    return parser.parse_args()
+
+
+class NoRedirect(urllib.request.HTTPRedirectHandler):
+    """Presmerovania nesledujeme – meria sa len samotná trasa."""
+
+    def redirect_request(self, *args, **kwargs):
+        return None
+
+
+class Stats:
+    """Latencie a chyby po trasách, zdieľané medzi vláknami."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.latencies = defaultdict(list)
+        self.errors = defaultdict(int)
+
+    def add(self, route, elapsed, ok):
+        with self.lock:
+            self.latencies[route].append(elapsed)
+            if not ok:
+                self.errors[route] += 1
+
+    def report(self, duration):
+        rows = {}
+        for route in sorted(self.latencies):
+            timings = sorted(self.latencies[route])
+            count = len(timings)
+            rows[route] = {
+                "requests": count,
+                "rps": count / duration,
+                "p50_ms": percentile(timings, 50) * 1000,
+                "p95_ms": percentile(timings, 95) * 1000,
+                "p99_ms": percentile(timings, 99) * 1000,
+                "error_pct": 100 * self.errors[route] / count,
+            }
+        return rows
+
+
+def percentile(sorted_values, p):
+    index = max(0, int(round(p / 100 * len(sorted_values))) - 1)
+    return sorted_values[min(index, len(sorted_values) - 1)]
+
+
+class VirtualUser:
+    """Jeden prihlásený používateľ s vlastnou session (cookies)."""
+
+    def __init__(self, base_url, email, password, stats, timeout, history_weeks=156, export_wait=300):
+        self.base_url = base_url.rstrip("/")
+        self.stats = stats
+        self.timeout = timeout
+        self.history_weeks = history_weeks
+        self.export_wait = export_wait
+        self.opener = urllib.request.build_opener(
+            urllib.request.HTTPCookieProcessor(http.cookiejar.CookieJar()), NoRedirect()
+        )
+        self.project_ids = []
+        self.login(email, password)
+
+    def request(self, route, path, data=None, headers=None):
+        """Pošle požiadavku a zapíše latenciu pod `route`. Vráti (status, location, telo)."""
+        req = urllib.request.Request(self.base_url + path, data=data, headers=headers or {})
+        start = time.perf_counter()
+        try:
+            with self.opener.open(req, timeout=self.timeout) as response:
+                status, location, body = response.status, None, response.read()
+        except urllib.error.HTTPError as e:
+            status, location, body = e.code, e.headers.get("Location"), e.read()
+        except (urllib.error.URLError, OSError):
+            self.stats.add(route, time.perf_counter() - start, ok=False)
+            return None, None, b""
+        elapsed = time.perf_counter() - start
+        # presmerovanie na prihlásenie = stratená session, tiež chyba
+        ok = status < 400 and not (location and urllib.parse.urlparse(location).path in ("/", "/login"))
+        self.stats.add(route, elapsed, ok)
+        return status, location, body
+
+    def login(self, email, password):
+        data = urllib.parse.urlencode({"email": email, "password": password}).encode()
+        status, location, _ = self.request("POST /login", "/login", data)
+        if status != 302 or not location or "dashboard" not in location:
+            raise RuntimeError(f"prihlásenie {email} zlyhalo ({status})")
+        _, _, body = self.request("GET /dashboard", "/dashboard")
+        match = PROJECT_SELECT_RE.search(body.decode("utf-8", "replace"))
+        self.project_ids = OPTION_RE.findall(match.group(1)) if match else []
+
+    # ---------- akcie ----------
+
+    def dashboard_week(self, rnd):
+        year, week, _ = (date.today() - timedelta(weeks=rnd.randint(0, 12))).isocalendar()
+        # stránka si grafy hneď dotiahne z API – patrí to k jednému načítaniu
+        self.request("GET /dashboard", f"/dashboard?year={year}&week={week}")
+        self.request("GET /api/dashboard/summary", f"/api/dashboard/summary?year={year}&week={week}")
+
+    def add_record(self, rnd):
+        if not self.project_ids:
+            return
+        fields = {"project_id": rnd.choice(self.project_ids)}
+        for i in range(rnd.randint(1, 4)):
+            day = date.today() - timedelta(days=rnd.randint(0, 6))
+            fields[f"addresses[{i}][address]"] = f"Záťažová {rnd.randint(1, 200)}"
+            fields[f"addresses[{i}][date]"] = day.isoformat()
+            if rnd.random() < 0.7:
+                fields[f"addresses[{i}][unit_type]"] = "hodiny"
+                fields[f"addresses[{i}][amount]"] = str(rnd.choice([4, 6, 8]))
+            else:
+                fields[f"addresses[{i}][unit_type]"] = "m2"
+                fields[f"addresses[{i}][m2_type]"] = rnd.choice(["montaz", "demontaz"])
+                fields[f"addresses[{i}][amount]"] = f"{rnd.uniform(5, 120):.1f}"
+        self.request("POST /add_record", "/add_record", urllib.parse.urlencode(fields).encode())
+
+    def upload_document(self, rnd):
+        boundary = uuid.uuid4().hex
+        filename = f"load_{uuid.uuid4().hex[:12]}.pdf"
+        content = b"%PDF-1.4\n" + bytes(rnd.getrandbits(8) for _ in range(rnd.randint(20_000, 200_000)))
+        body = (
+            f"--{boundary}\r\n"
+            f'Content-Disposition: form-data; name="file"; filename="{filename}"\r\n'
+            "Content-Type: application/pdf\r\n\r\n"
+        ).encode() + content + f"\r\n--{boundary}--\r\n".encode()
+        self.request("POST /documents", "/documents", body,
+                     {"Content-Type": f"multipart/form-data; boundary={boundary}"})
+
+    def export_filters(self, rnd):
+        """Náhodný týždeň alebo rozsah dátumov z histórie – iný report ako minule."""
+        if rnd.random() < 0.5:
+            year, week, _ = (date.today() - timedelta(weeks=rnd.randint(0, self.history_weeks))).isocalendar()
+            params = {"year": year, "week": week}
+        else:
+            start = date.today() - timedelta(days=rnd.randint(0, self.history_weeks * 7))
+            params = {"date_from": start.isoformat(),
+                      "date_to": (start + timedelta(days=rnd.randint(6, 30))).isoformat()}
+        if rnd.random() < 0.3:
+            params["unit_type"] = rnd.choice(["hodiny", "m2"])
+        return params
+
+    def export_pdf(self, rnd):
+        """PDF cez frontu úloh ako v prehliadači: zadanie, čakanie, stiahnutie."""
+        started = time.perf_counter()
+        data = urllib.parse.urlencode(self.export_filters(rnd)).encode()
+        status, _, body = self.request("POST /export/jobs/pdf", "/export/jobs/pdf", data)
+        if status not in (200, 202):
+            return
+        job = json.loads(body)
+        label = "PDF job z cache" if job.get("id") is None else "PDF job celkovo"
+
+        while job["status"] in ("queued", "running"):
+            if time.perf_counter() - started > self.export_wait:
+                self.stats.add(label, time.perf_counter() - started, ok=False)
+                return
+            time.sleep(EXPORT_POLL_S)
+            status, _, body = self.request("GET /export/jobs/<id>", job["status_url"])
+            if status != 200:
+                self.stats.add(label, time.perf_counter() - started, ok=False)
+                return
+            job = json.loads(body)
+
+        ok = job["status"] == "done"
+        if ok:
+            route = "GET /export/pdf" if job.get("id") is None else "GET /export/jobs/<id>/download"
+            status, _, _ = self.request(route, job["download_url"])
+            ok = status == 200
+        self.stats.add(label, time.perf_counter() - started, ok)
+
+    def crews(self, rnd):
+        year, week, _ = date.today().isocalendar()
+        self.request("GET /crews", f"/crews?year={year}&week={week}")
+
+
+WORKER_MIX = [("dashboard_week", 6), ("add_record", 3), ("upload_document", 1)]
+ADMIN_MIX = [("dashboard_week", 4), ("export_pdf", 3), ("crews", 1)]
+
+
+def run_user(make_user, mix, think, stop, rnd):
+    try:
+        user = make_user()
+    except RuntimeError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return
+    actions, weights = zip(*mix)
+    while not stop.is_set():
+        getattr(user, rnd.choices(actions, weights=weights)[0])(rnd)
+        stop.wait(rnd.expovariate(1 / think) if think > 0 else 0)
+
+
+def run_stage(args, workers, seed):
+    stats = Stats()
+    stop = threading.Event()
+    threads = []
+    for i in range(workers + args.admins):
+        if i < workers:
+            email = f"user{i % args.user_count:04d}@example.com"
+            password, mix = args.password, WORKER_MIX
+        else:
+            email, password, mix = args.admin_email, args.admin_password, ADMIN_MIX
+        make_user = (lambda e=email, p=password: VirtualUser(
+            args.base_url, e, p, stats, args.timeout, args.history_weeks, args.export_wait))
+        thread = threading.Thread(target=run_user, daemon=True,
+                                  args=(make_user, mix, args.think, stop, random.Random(seed + i)))
+        thread.start()
+        threads.append(thread)
+
+    time.sleep(args.duration)
+    stop.set()
+    for thread in threads:
+        thread.join(args.timeout)
+    return stats.report(args.duration)
+
+
+def print_report(workers, admins, rows):
+    print(f"\n=== {workers} robotníkov + {admins} adminov ===")
+    print(f"{'trasa':<32}{'počet':>8}{'req/s':>8}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'chyby %':>9}")
+    for route, r in rows.items():
+        print(f"{route:<32}{r['requests']:>8}{r['rps']:>8.1f}{r['p50_ms']:>9.0f}"
+              f"{r['p95_ms']:>9.0f}{r['p99_ms']:>9.0f}{r['error_pct']:>9.1f}")
+    # „PDF job …“ je celé čakanie na export, nie HTTP požiadavka – do súčtu nepatrí
+    http_rows = [r for route, r in rows.items() if not route.startswith("PDF job")]
+    total = sum(r["requests"] for r in http_rows)
+    print(f"{'spolu (HTTP)':<32}{total:>8}{sum(r['rps'] for r in http_rows):>8.1f}")
+
+
+def main():
+    args = parse_args()
+    results = []
+    for stage, workers in enumerate(args.stages or [args.workers]):
+        rows = run_stage(args, workers, seed=stage * 10_000)
+        print_report(workers, args.admins, rows)
+        results.append({"workers": workers, "admins": args.admins, "routes": rows})
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"base_url": args.base_url, "duration": args.duration, "stages": results}, f, indent=2)
+        print(f"\n💾 Výsledky uložené do {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,178 @@
+"""Benchmark najpoužívanejších stránok cez Flask test client.
+
+Meria dashboard (admin aj majster), detail projektu, PDF export, PDF partie
+a stránku partií nad dátami z benchmarks/seed.py. Dashboard sa meria ako
+celé načítanie – stránka aj /api/dashboard/summary, ktoré si stránka hneď
+stiahne pre grafy – a samostatne aj jeho API. Pre každý scenár vypíše
+latenciu (p50 / p95 / max), počet SQL dotazov na požiadavku a špičku
+alokovanej pamäte počas požiadavky (tracemalloc).
+
+    DATABASE_URL=postgresql://localhost/vykazy_bench python benchmarks/routes.py
+    DATABASE_URL=... python benchmarks/routes.py --runs 20 --only dashboard_admin export_pdf --json out.json
+
+PDF exporty sa merajú bez cache reportov (vždy sa vykresľujú), inak by sa
+od druhého behu meralo len čítanie súboru.
+"""
+import argparse
+import json
+import os
+import shutil
+import statistics
+import sys
+import time
+import tracemalloc
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10, help="meraní na scenár (po jednom zahriatí)")
+    parser.add_argument("--only", nargs="*", help="len vybrané scenáre")
+    parser.add_argument("--json", help="ulož výsledky aj do JSON súboru (na porovnanie behov)")
+    return parser.parse_args()
+
+
+def pick_targets(db, models):
+    """Najťažšie reálne prípady z dát: najrušnejší týždeň, najväčší projekt, majster, partia."""
+    from sqlalchemy import func
+    Record, User, CrewWeek, CrewWeekMember = models
+
+    year, week = (
+        db.session.query(Record.iso_year, Record.iso_week)
+        .group_by(Record.iso_year, Record.iso_week)
+        .order_by(func.count(Record.id).desc())
+        .first()
+    )
+    project_id = (
+        db.session.query(Record.project_id)
+        .group_by(Record.project_id)
+        .order_by(func.count(Record.id).desc())
+        .limit(1).scalar()
+    )
+    foreman = (
+        db.session.query(User)
+        .join(Record, Record.user_id == User.id)
+        .filter(Record.iso_year == year, Record.iso_week == week)
+        .group_by(User.id)
+        .order_by(func.count(Record.id).desc())
+        .first()
+    )
+    crew_week_id = (
+        db.session.query(CrewWeek.id)
+        .join(CrewWeekMember, CrewWeekMember.crew_week_id == CrewWeek.id)
+        .filter(CrewWeek.year == year, CrewWeek.week == week)
+        .group_by(CrewWeek.id)
+        .order_by(func.count(CrewWeekMember.id).desc())
+        .limit(1).scalar()
+    )
+    return year, week, project_id, foreman, crew_week_id
+
+
+def main():
+    args = parse_args()
+    if not os.getenv("DATABASE_URL"):
+        sys.exit("❌ Zadaj DATABASE_URL (lokálna databáza pre benchmarky).")
+
+    import logging
+    from sqlalchemy import event
+    import app as app_module
+    from app import app, db, User, Record, CrewWeek, CrewWeekMember
+
+    logging.getLogger().setLevel(logging.WARNING)  # bez logu každej požiadavky
+
+    with app.app_context():
+        year, week, project_id, foreman, crew_week_id = pick_targets(db, (Record, User, CrewWeek, CrewWeekMember))
+        admin = User.query.filter_by(name="admin").first()
+        engine = db.engine
+    if not admin or not foreman:
+        sys.exit("❌ V databáze chýbajú dáta – spusti najprv benchmarks/seed.py.")
+
+    week_args = f"year={year}&week={week}"
+    dashboard = [f"/dashboard?{week_args}", f"/api/dashboard/summary?{week_args}"]
+    # scenár = používateľ + URL, ktoré sa načítajú spolu (čas a dotazy sa sčítajú)
+    scenarios = {
+        "dashboard_admin": (admin, dashboard),
+        "dashboard_foreman": (foreman, dashboard),
+        "summary_admin": (admin, [f"/api/dashboard/summary?{week_args}"]),
+        "summary_foreman": (foreman, [f"/api/dashboard/summary?{week_args}"]),
+        "records_admin": (admin, [f"/api/dashboard/records?{week_args}"]),
+        "project_detail": (admin, [f"/project/{project_id}"]),
+        "export_pdf": (admin, [f"/export/pdf?{week_args}"]),
+        "export_crew_pdf": (admin, [f"/crews/{crew_week_id}/pdf"]) if crew_week_id else None,
+        "crews": (admin, [f"/crews?{week_args}"]),
+    }
+    print(f"📅 týždeň {week}/{year}, projekt {project_id}, majster {foreman.name}, partia {crew_week_id}")
+
+    queries = [0]
+
+    def count_query(*_):
+        queries[0] += 1
+
+    event.listen(engine, "before_cursor_execute", count_query)
+
+    def run(client, urls):
+        if any("/pdf" in url for url in urls):
+            # PDF vždy vykresliť – cache reportov vyprázdniť
+            shutil.rmtree(app_module.report_cache.folder, ignore_errors=True)
+            os.makedirs(app_module.report_cache.folder, exist_ok=True)
+        queries[0] = 0
+        elapsed = 0.0
+        for url in urls:
+            # bez If-None-Match – API s ETagom by inak vrátilo 304 bez práce
+            start = time.perf_counter()
+            response = client.get(url)
+            response.get_data()  # aj streamované odpovede dočítať
+            elapsed += time.perf_counter() - start
+            if response.status_code != 200:
+                raise RuntimeError(f"{url} → {response.status_code}")
+        return elapsed, queries[0]
+
+    results = {}
+    for name, scenario in scenarios.items():
+        if scenario is None or (args.only and name not in args.only):
+            continue
+        user, urls = scenario
+        client = app.test_client()
+        with client.session_transaction() as sess:
+            sess["user"] = {"id": user.id, "name": user.name, "is_admin": user.is_admin}
+
+        run(client, urls)  # zahriatie
+        timings, query_counts = [], []
+        for _ in range(args.runs):
+            elapsed, count = run(client, urls)
+            timings.append(elapsed)
+            query_counts.append(count)
+
+        # pamäť zvlášť – tracemalloc spomaľuje, nesmie skresliť latenciu
+        tracemalloc.start()
+        run(client, urls)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        timings.sort()
+        results[name] = {
+            "urls": urls,
+            "p50_ms": statistics.median(timings) * 1000,
+            "p95_ms": timings[max(0, int(len(timings) * 0.95) - 1)] * 1000,
+            "max_ms": timings[-1] * 1000,
+            "queries": max(query_counts),
+            "peak_mb": peak / 1024 / 1024,
+        }
+
+    event.remove(engine, "before_cursor_execute", count_query)
+
+    print(f"\n{'scenár':<20}{'p50 ms':>10}{'p95 ms':>10}{'max ms':>10}{'SQL':>6}{'pamäť MB':>10}")
+    for name, r in results.items():
+        print(f"{name:<20}{r['p50_ms']:>10.1f}{r['p95_ms']:>10.1f}{r['max_ms']:>10.1f}{r['queries']:>6}{r['peak_mb']:>10.1f}")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"runs": args.runs, "year": year, "week": week, "results": results}, f, indent=2)
+        print(f"\n💾 Výsledky uložené do {args.json}")
+
+
+if __name__ == "__main__":
+    main()
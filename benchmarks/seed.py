@@ -0,0 +1,186 @@
+"""Naplní databázu syntetickými dátami pre benchmarky.
+
+Vytvorí používateľov, projekty, záznamy, partie (aj po týždňoch s členmi)
+a dokumenty v realistickom pomere – pár majstrov píše väčšinu záznamov,
+projekty bežia niekoľko týždňov až mesiacov. Na Postgrese sa záznamy
+vkladajú cez COPY, 5 miliónov riadkov je otázka minút.
+
+    DATABASE_URL=postgresql://localhost/vykazy_bench python benchmarks/seed.py --reset
+    DATABASE_URL=... python benchmarks/seed.py --users 200 --projects 500 --records 5000000
+
+DATABASE_URL musí byť zadané explicitne – skript nikdy nepoužije predvolenú
+(produkčnú) databázu z app.py.
+"""
+import argparse
+import csv
+import io
+import os
+import random
+import sys
+import time
+from datetime import date, timedelta
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+RECORD_COLUMNS = ["user_id", "project_id", "date", "iso_year", "iso_week",
+                  "amount", "unit_type", "m2_type", "note", "address"]
+NOTES = [None, None, None, "montáž lešenia", "demontáž", "presun materiálu", "doprava", "oprava"]
+STREETS = ["Hlavná", "Štúrova", "Mlynská", "Obchodná", "Palisády", "Záhradnícka", "Račianska"]
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=200)
+    parser.add_argument("--projects", type=int, default=500)
+    parser.add_argument("--records", type=int, default=5_000_000)
+    parser.add_argument("--crews", type=int, default=40)
+    parser.add_argument("--documents", type=int, default=2000)
+    parser.add_argument("--years", type=float, default=3, help="koľko rokov histórie (končí dnes)")
+    parser.add_argument("--batch", type=int, default=50_000, help="riadkov záznamov na dávku")
+    parser.add_argument("--seed", type=int, default=42, help="seed generátora – rovnaké dáta pri každom behu")
+    parser.add_argument("--reset", action="store_true", help="zmaž a znovu vytvor všetky tabuľky")
+    return parser.parse_args()
+
+
+def insert_records(db, Record, rows):
+    """Vloží dávku záznamov – COPY na Postgrese, inak executemany."""
+    if db.engine.dialect.name != "postgresql":
+        from sqlalchemy import insert
+        db.session.execute(insert(Record), [dict(zip(RECORD_COLUMNS, row)) for row in rows])
+        return
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for row in rows:
+        writer.writerow(["" if v is None else v for v in row])
+    buffer.seek(0)
+    sql = f"COPY records ({', '.join(RECORD_COLUMNS)}) FROM STDIN WITH (FORMAT csv, NULL '')"
+    cursor = db.session.connection().connection.cursor()
+    if hasattr(cursor, "copy_expert"):  # psycopg2
+        cursor.copy_expert(sql, buffer)
+    else:  # psycopg 3
+        with cursor.copy(sql) as copy:
+            copy.write(buffer.getvalue())
+
+
+def main():
+    args = parse_args()
+    if not os.getenv("DATABASE_URL"):
+        sys.exit("❌ Zadaj DATABASE_URL (lokálna databáza pre benchmarky).")
+
+    from werkzeug.security import generate_password_hash
+    from app import (app, db, init_database, rebuild_rollup, User, Project, Record,
+                     Crew, CrewWeek, CrewWeekMember, Document)
+
+    rnd = random.Random(args.seed)
+    today = date.today()
+    first_day = today - timedelta(days=int(args.years * 365))
+    days = (today - first_day).days
+
+    with app.app_context():
+        if args.reset:
+            print("🗑️ Mažem a znovu vytváram tabuľky...")
+            db.drop_all()
+        init_database()
+
+        started = time.perf_counter()
+
+        # --- používatelia (heslo všetkých: heslo123) ---
+        password = generate_password_hash("heslo123")
+        users = [User(name=f"user{i:04d}", email=f"user{i:04d}@example.com", password=password)
+                 for i in range(args.users)]
+        db.session.add_all(users)
+        db.session.flush()
+        user_ids = [u.id for u in users]
+        # pár majstrov píše väčšinu záznamov (Pareto)
+        user_weights = [1 / (rank + 1) ** 0.8 for rank in range(len(user_ids))]
+
+        # --- projekty s obdobím, kedy bežia ---
+        projects = [Project(name=f"Projekt {i:04d}") for i in range(args.projects)]
+        db.session.add_all(projects)
+        db.session.flush()
+        windows = {}
+        for p in projects:
+            start = first_day + timedelta(days=rnd.randrange(days))
+            length = rnd.randint(14, 240)
+            windows[p.id] = (start, min(start + timedelta(days=length), today))
+        project_ids = list(windows)
+        project_weights = [(windows[pid][1] - windows[pid][0]).days + 1 for pid in project_ids]
+        db.session.commit()
+        print(f"👤 {len(user_ids)} používateľov, 🏗️ {len(project_ids)} projektov")
+
+        # --- záznamy po dávkach ---
+        inserted = 0
+        while inserted < args.records:
+            size = min(args.batch, args.records - inserted)
+            chosen_users = rnd.choices(user_ids, weights=user_weights, k=size)
+            chosen_projects = rnd.choices(project_ids, weights=project_weights, k=size)
+            rows = []
+            for user_id, project_id in zip(chosen_users, chosen_projects):
+                start, end = windows[project_id]
+                r_date = start + timedelta(days=rnd.randrange((end - start).days + 1))
+                iso_year, iso_week, _ = r_date.isocalendar()
+                if rnd.random() < 0.7:
+                    unit_type, m2_type, amount = "hodiny", None, rnd.choice([4, 6, 8, 8, 8, 10])
+                else:
+                    unit_type = "m2"
+                    m2_type = rnd.choice(["montaz", "montaz", "demontaz"])
+                    amount = round(rnd.uniform(5, 250), 1)
+                address = f"{rnd.choice(STREETS)} {rnd.randint(1, 120)}" if rnd.random() < 0.5 else None
+                rows.append((user_id, project_id, r_date, iso_year, iso_week,
+                             amount, unit_type, m2_type, rnd.choice(NOTES), address))
+            insert_records(db, Record, rows)
+            db.session.commit()
+            inserted += size
+            print(f"📝 záznamy: {inserted}/{args.records} ({time.perf_counter() - started:.0f} s)")
+
+        # --- partie po týždňoch ---
+        crews = [Crew(name=f"Partia {i:03d}") for i in range(args.crews)]
+        db.session.add_all(crews)
+        db.session.flush()
+        monday = first_day - timedelta(days=first_day.weekday())
+        crew_weeks = 0
+        while monday <= today:
+            iso_year, iso_week, _ = monday.isocalendar()
+            for crew in crews:
+                if rnd.random() < 0.2:
+                    continue  # partia v tomto týždni nepracuje
+                active = [pid for pid in project_ids if windows[pid][0] <= monday <= windows[pid][1]]
+                cw = CrewWeek(crew_id=crew.id, year=iso_year, week=iso_week,
+                              project_id=rnd.choice(active) if active else None,
+                              note=rnd.choice(NOTES))
+                db.session.add(cw)
+                db.session.flush()
+                for user_id in rnd.sample(user_ids, k=min(len(user_ids), rnd.randint(3, 8))):
+                    db.session.add(CrewWeekMember(crew_week_id=cw.id, user_id=user_id))
+                crew_weeks += 1
+            db.session.commit()
+            monday += timedelta(days=7)
+        print(f"👥 {len(crews)} partií, {crew_weeks} týždňov partií")
+
+        # --- dokumenty (len záznamy v tabuľke, bez súborov) ---
+        db.session.add_all(
+            Document(user_id=rnd.choice(user_ids), filename=f"doc_{i:06d}.pdf")
+            for i in range(args.documents)
+        )
+        db.session.commit()
+        print(f"📄 {args.documents} dokumentov")
+
+        print("🔄 Prepočítavam súhrn record_rollups...")
+        rebuild_rollup()
+        db.session.commit()
+
+        if db.engine.dialect.name == "postgresql":
+            # štatistiky pre plánovač – inak by prvé merania bežali s odhadmi pre prázdne tabuľky
+            with db.engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+                conn.exec_driver_sql("SET statement_timeout = 0")
+                conn.exec_driver_sql("ANALYZE")
+                conn.exec_driver_sql("RESET statement_timeout")
+
+        print(f"✅ Hotovo za {time.perf_counter() - started:.0f} s")
+
+
+if __name__ == "__main__":
+    main()
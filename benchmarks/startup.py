@@ -0,0 +1,66 @@
+"""Benchmark štartu workeru: čas importu aplikácie a pamäť procesu.
+
+Každé meranie beží v novom procese Pythonu – presne ako pri štarte gunicorn
+workeru. Meria sa import app.py (+ voliteľne prvá požiadavka) a maximálna
+rezidentná pamäť (RSS) procesu.
+
+    python benchmarks/startup.py              # 10 behov, výsledok ako medián
+    python benchmarks/startup.py --runs 20 --first-request
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CHILD = """
+import json, resource, sys, time
+start = time.perf_counter()
+import app
+imported = time.perf_counter()
+first_request = None
+if {first_request!r}:
+    app.app.test_client().get("/")
+    first_request = time.perf_counter() - imported
+print(json.dumps({{
+    "import_s": imported - start,
+    "first_request_s": first_request,
+    "max_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    "reportlab": "reportlab" in sys.modules,
+    "pandas": "pandas" in sys.modules,
+}}))
+"""
+
+
+def measure(first_request):
+    out = subprocess.run(
+        [sys.executable, "-c", CHILD.format(first_request=first_request)],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    ).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--first-request", action="store_true", help="zmeraj aj prvú požiadavku na /")
+    args = parser.parse_args()
+
+    measure(args.first_request)  # zahriatie – .pyc súbory, cache disku
+    results = [measure(args.first_request) for _ in range(args.runs)]
+
+    median = lambda key: statistics.median(r[key] for r in results)
+    print(f"behov: {args.runs}")
+    print(f"import app:        {median('import_s') * 1000:8.1f} ms (medián)")
+    if args.first_request:
+        print(f"prvá požiadavka:   {median('first_request_s') * 1000:8.1f} ms (medián)")
+    print(f"max RSS:           {median('max_rss_mb'):8.1f} MB (medián)")
+    print(f"načítaný ReportLab: {'áno' if results[0]['reportlab'] else 'nie'}, pandas: {'áno' if results[0]['pandas'] else 'nie'}")
+
+
+if __name__ == "__main__":
+    main()
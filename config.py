@@ -0,0 +1,43 @@
+"""Nastavenia databázového poolu z premenných prostredia.
+
+Každý gunicorn worker má vlastný pool, spolu teda môže otvoriť až
+workers × (DB_POOL_SIZE + DB_MAX_OVERFLOW) spojení – musí to byť menej
+ako max_connections na Postgrese. DB_POOL_SIZE by mal pokryť počet vlákien
+workeru (GUNICORN_THREADS), aby vlákna nečakali na voľné spojenie.
+"""
+import os
+
+
+def env_int(name, default):
+    return int(os.getenv(name, default))
+
+
+def env_bool(name, default):
+    return os.getenv(name, str(default)).strip().lower() in ("1", "true", "yes", "on")
+
+
+DB_POOL_SIZE = env_int("DB_POOL_SIZE", 5)
+DB_MAX_OVERFLOW = env_int("DB_MAX_OVERFLOW", 5)
+DB_POOL_TIMEOUT = env_int("DB_POOL_TIMEOUT", 30)  # s – čakanie na voľné spojenie
+DB_POOL_RECYCLE = env_int("DB_POOL_RECYCLE", 1800)  # s – staršie spojenia sa zahodia
+DB_POOL_PRE_PING = env_bool("DB_POOL_PRE_PING", True)  # preverí spojenie pred použitím
+DB_STATEMENT_TIMEOUT_MS = env_int("DB_STATEMENT_TIMEOUT_MS", 30000)  # 0 = bez limitu
+
+
+def engine_options(database_uri):
+    """SQLALCHEMY_ENGINE_OPTIONS pre danú databázu."""
+    options = {"pool_pre_ping": DB_POOL_PRE_PING}
+    if not database_uri.startswith("postgres"):
+        # SQLite (lokálne skúšanie) – predvolený pool stačí
+        return options
+
+    options.update(
+        pool_size=DB_POOL_SIZE,
+        max_overflow=DB_MAX_OVERFLOW,
+        pool_timeout=DB_POOL_TIMEOUT,
+        pool_recycle=DB_POOL_RECYCLE,
+    )
+    if DB_STATEMENT_TIMEOUT_MS:
+        # zaseknutý dotaz neblokuje worker donekonečna; migrácie si limit vypínajú
+        options["connect_args"] = {"options": f"-c statement_timeout={DB_STATEMENT_TIMEOUT_MS}"}
+    return options
@@ -0,0 +1,177 @@
+"""Exporty PDF na pozadí – bez externého brokera.
+
+Vykresľovanie beží v lokálnom poole procesov a výsledok sa ukladá na disk.
+Stav úlohy je JSON súbor vedľa PDF, takže stav aj stiahnutie obslúži
+ktorýkoľvek gunicorn worker, nielen ten, ktorý úlohu prijal.
+"""
+import json
+import logging
+import multiprocessing
+import os
+import re
+import threading
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+
+log = logging.getLogger(__name__)
+
+JOB_ID_RE = re.compile(r"[0-9a-f]{32}")
+
+
+def _read_json(path):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _write_json(path, data):
+    # zápis cez dočasný súbor – čitateľ nikdy neuvidí polovičný JSON
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+    os.replace(tmp, path)
+
+
+def _run_job(meta_path, pdf_path, render, kwargs):
+    """Beží v procese z poolu: vykreslí PDF na disk a zapíše stav úlohy."""
+    meta = _read_json(meta_path)
+    if meta["status"] == "error":
+        # úlohu medzitým označil get() ako neskorú – nevykresľovať a chybu neprepísať
+        return
+    meta.update(status="running", started_at=time.time())
+    _write_json(meta_path, meta)
+
+    try:
+        pdf = render(**kwargs)
+        tmp = f"{pdf_path}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(pdf)
+        os.replace(tmp, pdf_path)
+        meta.update(status="done", size=len(pdf))
+    except Exception as e:
+        log.exception("Export %s zlyhal", meta.get("id"))
+        meta.update(status="error", error=str(e))
+
+    meta["finished_at"] = time.time()
+    _write_json(meta_path, meta)
+
+
+class ExportJobs:
+    """Fronta exportných úloh nad lokálnym ProcessPoolExecutorom."""
+
+    def __init__(self, folder, max_workers=2, max_age=24 * 3600, timeout=600, queue_timeout=1800):
+        self.folder = os.path.abspath(folder)
+        self.max_workers = max_workers
+        self.max_age = max_age
+        self.timeout = timeout
+        self.queue_timeout = queue_timeout
+        self._executor = None
+        self._lock = threading.Lock()
+        os.makedirs(self.folder, exist_ok=True)
+
+    def _get_executor(self):
+        # pool sa vytvára až pri prvej úlohe – v gunicorn workeri, nie v master procese
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._executor
+
+    def _meta_path(self, job_id):
+        return os.path.join(self.folder, f"{job_id}.json")
+
+    def submit(self, owner_id, download_name, render, kwargs, output_path=None):
+        """Zaradí vykreslenie render(**kwargs) do poolu a vráti id úlohy.
+
+        render a kwargs sa posielajú do iného procesu, musia byť picklovateľné
+        (funkcia na úrovni modulu, čisté dáta – žiadne ORM objekty).
+        output_path – kam uložiť PDF (napr. do cache reportov); predvolene
+        priečinok úloh.
+        """
+        self.cleanup()
+
+        job_id = uuid.uuid4().hex
+        meta_path = self._meta_path(job_id)
+        pdf_path = output_path or os.path.join(self.folder, f"{job_id}.pdf")
+        _write_json(meta_path, {
+            "id": job_id,
+            "status": "queued",
+            "owner_id": owner_id,
+            "download_name": download_name,
+            "pdf_path": pdf_path,
+            "created_at": time.time(),
+        })
+
+        future = self._get_executor().submit(_run_job, meta_path, pdf_path, render, kwargs)
+        future.add_done_callback(lambda f: self._on_done(job_id, f))
+        return job_id
+
+    def _on_done(self, job_id, future):
+        # chyby vo vnútri _run_job sa zapíšu tam; sem padne napr. rozbitý pool
+        error = future.exception()
+        if error is None:
+            return
+        log.error("Export %s sa nepodarilo spustiť: %s", job_id, error)
+        if isinstance(error, BrokenProcessPool):
+            # rozbitý pool už nič neprijme – ďalšia úloha si vytvorí nový
+            with self._lock:
+                if self._executor is not None:
+                    self._executor.shutdown(wait=False)
+                    self._executor = None
+        meta = self.get(job_id)
+        if meta and meta["status"] in ("queued", "running"):
+            meta.update(status="error", error=str(error), finished_at=time.time())
+            _write_json(self._meta_path(job_id), meta)
+
+    def get(self, job_id):
+        """Stav úlohy ako dict, alebo None ak úloha neexistuje.
+
+        Úloha, ktorá nedobehla do `timeout` sekúnd od spustenia alebo sa vo
+        fronte nedočkala spustenia do `queue_timeout` sekúnd, sa označí ako
+        chybná – pool mohol zaniknúť bez callbacku (recyklovaný alebo zabitý
+        gunicorn worker). Hotová úloha, ktorej PDF medzitým zmizlo z disku,
+        je tiež chybná.
+        """
+        if not JOB_ID_RE.fullmatch(job_id or ""):
+            return None
+        try:
+            meta = _read_json(self._meta_path(job_id))
+        except (OSError, ValueError):
+            return None
+        now = time.time()
+        if meta["status"] == "done":
+            # PDF v cache reportov mohla zmazať eviction – dotyk ho zároveň posunie na koniec LRU
+            try:
+                os.utime(meta["pdf_path"])
+            except OSError:
+                log.warning("Export %s: PDF %s už neexistuje", job_id, meta["pdf_path"])
+                meta.update(status="error", error="Vygenerované PDF už nie je k dispozícii, spusti export znova.")
+                _write_json(self._meta_path(job_id), meta)
+        elif meta["status"] == "queued" and now - meta["created_at"] > self.queue_timeout:
+            log.error("Export %s sa nespustil do %s s", job_id, self.queue_timeout)
+            meta.update(status="error", error="Export sa nedostal na rad, skús to znova.", finished_at=now)
+            _write_json(self._meta_path(job_id), meta)
+        elif meta["status"] == "running" and now - meta["started_at"] > self.timeout:
+            log.error("Export %s nedobehol do %s s", job_id, self.timeout)
+            meta.update(status="error", error="Export nedobehol včas, skús to znova.", finished_at=now)
+            _write_json(self._meta_path(job_id), meta)
+        return meta
+
+    def cleanup(self):
+        """Zmaže úlohy a PDF staršie ako max_age sekúnd."""
+        limit = time.time() - self.max_age
+        try:
+            names = os.listdir(self.folder)
+        except OSError:
+            return
+        for name in names:
+            path = os.path.join(self.folder, name)
+            try:
+                if os.path.getmtime(path) < limit:
+                    os.remove(path)
+            except OSError:
+                continue
@@ -0,0 +1,48 @@
+"""Nastavenia gunicornu (načíta sa automaticky, Procfile ho uvádza explicitne).
+
+Predvolene gthread workery: každý worker obslúži GUNICORN_THREADS požiadaviek
+naraz, väčšina času je čakanie na databázu. Preload načíta aplikáciu raz
+v master procese; spojenia do databázy sa po forku zahodia, aby dva workery
+nikdy nezdieľali jeden socket.
+"""
+import os
+import shutil
+
+from config import env_bool, env_int
+
+
+# metriky zo všetkých workerov sa zbierajú v jednom priečinku (metrics.py);
+# musí existovať skôr, než sa načíta aplikácia (preload). Súbory z predchádzajúceho
+# behu sa zmažú, inak by sa pripočítali k novým.
+os.environ.setdefault("PROMETHEUS_MULTIPROC_DIR", "/tmp/prometheus_multiproc")
+shutil.rmtree(os.environ["PROMETHEUS_MULTIPROC_DIR"], ignore_errors=True)
+os.makedirs(os.environ["PROMETHEUS_MULTIPROC_DIR"], exist_ok=True)
+
+
+bind = f"0.0.0.0:{os.getenv('PORT', '8000')}"
+workers = env_int("WEB_CONCURRENCY", 2)
+worker_class = os.getenv("GUNICORN_WORKER_CLASS", "gthread")
+threads = env_int("GUNICORN_THREADS", 4)
+preload_app = env_bool("GUNICORN_PRELOAD", True)
+
+timeout = env_int("GUNICORN_TIMEOUT", 60)
+graceful_timeout = 30
+keepalive = 5
+
+# worker sa po čase vymení – únik pamäte (pandas, ReportLab) nerastie donekonečna
+max_requests = env_int("GUNICORN_MAX_REQUESTS", 1000)
+max_requests_jitter = 100
+
+accesslog = "-"
+
+
+def child_exit(server, worker):
+    from prometheus_client import multiprocess
+    multiprocess.mark_process_dead(worker.pid)
+
+
+def post_fork(server, worker):
+    # pool zdedený z master procesu (preload) sa nesmie použiť – každý worker si otvorí vlastné spojenia
+    from app import app, db
+    with app.app_context():
+        db.engine.dispose(close=False)
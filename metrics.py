@@ -0,0 +1,56 @@
+"""Metriky pre Prometheus – latencia endpointov, SQL na požiadavku, vykresľovanie PDF.
+
+Pod gunicornom má každý worker vlastnú pamäť, preto prometheus_client beží
+v multiprocess režime: ak je nastavené PROMETHEUS_MULTIPROC_DIR (nastavuje
+gunicorn.conf.py), každý proces zapisuje hodnoty do súborov v tomto
+priečinku a /metrics ich pri scrape sčíta za všetky workery – aj za procesy
+exportov na pozadí.
+"""
+import os
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, Counter, Histogram, generate_latest, multiprocess,
+)
+
+
+REQUEST_LATENCY = Histogram(
+    "http_request_duration_seconds", "Trvanie požiadavky podľa endpointu",
+    ["endpoint", "method"],
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30),
+)
+REQUESTS = Counter(
+    "http_requests_total", "Počet požiadaviek podľa endpointu a stavového kódu",
+    ["endpoint", "method", "status"],
+)
+SQL_QUERIES = Histogram(
+    "http_request_sql_queries", "Počet SQL dotazov na jednu požiadavku",
+    ["endpoint"],
+    buckets=(0, 1, 2, 5, 10, 25, 50, 100, 250),
+)
+SQL_SECONDS = Histogram(
+    "http_request_sql_seconds", "Čas strávený v SQL počas jednej požiadavky",
+    ["endpoint"],
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5),
+)
+PDF_RENDER_SECONDS = Histogram(
+    "pdf_render_seconds", "Trvanie vykreslenia PDF reportu (ReportLab)",
+    buckets=(0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60),
+)
+
+
+def observe_request(endpoint, method, status, duration, sql_queries, sql_seconds):
+    endpoint = endpoint or "unknown"
+    REQUEST_LATENCY.labels(endpoint, method).observe(duration)
+    REQUESTS.labels(endpoint, method, str(status)).inc()
+    SQL_QUERIES.labels(endpoint).observe(sql_queries)
+    SQL_SECONDS.labels(endpoint).observe(sql_seconds)
+
+
+def render_metrics():
+    """Vráti (telo, content type) – v multiprocess režime súčet za všetky procesy."""
+    if os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry), CONTENT_TYPE_LATEST
@@ -0,0 +1,174 @@
+"""Verzované migrácie databázy (PostgreSQL).
+
+Aplikované verzie sa zapisujú do tabuľky schema_migrations, každá migrácia
+sa spustí práve raz. Indexy sa stavajú cez CREATE INDEX CONCURRENTLY –
+tabuľka sa počas stavby nezamkne pre zápis, takže migrácie môžu bežať aj
+za prevádzky. CONCURRENTLY nesmie bežať v transakcii, preto sa takéto
+migrácie (transactional=False) spúšťajú v autocommit režime.
+"""
+from collections import namedtuple
+
+from sqlalchemy import text
+
+
+Migration = namedtuple("Migration", "version name apply transactional")
+
+# ľubovoľné pevné číslo – dva súčasne spustené upgrady sa nepobijú
+MIGRATION_LOCK_ID = 730213
+
+
+def column_type(conn, table, column):
+    return conn.execute(text("""
+        SELECT data_type FROM information_schema.columns
+        WHERE table_schema = current_schema() AND table_name = :table AND column_name = :column
+    """), {"table": table, "column": column}).scalar()
+
+
+def create_index_concurrently(conn, name, table, columns):
+    """CREATE INDEX CONCURRENTLY – bez zámku na zápis. Volať mimo transakcie."""
+    # prerušená stavba (napr. deadlock, timeout) nechá po sebe neplatný index –
+    # IF NOT EXISTS by ho preskočilo, preto ho najprv zmažeme
+    invalid = conn.execute(text("""
+        SELECT 1 FROM pg_index i
+        JOIN pg_class c ON c.oid = i.indexrelid
+        WHERE c.relname = :name AND NOT i.indisvalid
+    """), {"name": name}).first()
+    if invalid:
+        print(f"⚠️ Index {name} je neplatný (prerušená stavba) – staviam ho znova.")
+        conn.execute(text(f"DROP INDEX CONCURRENTLY IF EXISTS {name}"))
+    conn.execute(text(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {table} ({', '.join(columns)})"))
+
+
+# ---------- MIGRÁCIE ----------
+
+def m001_records_columns(conn):
+    """Pôvodný upgrade.py: unit_type, records.date ako DATE, ISO rok a týždeň."""
+    conn.execute(text("ALTER TABLE records ADD COLUMN IF NOT EXISTS unit_type VARCHAR(10)"))
+    conn.execute(text("ALTER TABLE projects DROP COLUMN IF EXISTS unit_type"))
+
+    # prevod VARCHAR → DATE prepíše celú tabuľku, preto len ak ešte nebol urobený
+    if column_type(conn, "records", "date") != "date":
+        invalid = conn.execute(text(r"""
+            SELECT COUNT(*) FROM records
+            WHERE date IS NOT NULL
+              AND date::text !~ '^\d{4}-\d{2}-\d{2}$'
+        """)).scalar()
+        if invalid:
+            print(f"⚠️ {invalid} záznam(ov) má neplatný dátum – po prevode bude prázdny.")
+        conn.execute(text(r"""
+            ALTER TABLE records ALTER COLUMN date TYPE DATE
+            USING CASE
+                WHEN date::text ~ '^\d{4}-\d{2}-\d{2}$' THEN date::text::date
+            END
+        """))
+
+    conn.execute(text("ALTER TABLE records ADD COLUMN IF NOT EXISTS iso_year INTEGER"))
+    conn.execute(text("ALTER TABLE records ADD COLUMN IF NOT EXISTS iso_week INTEGER"))
+    conn.execute(text("""
+        UPDATE records
+        SET iso_year = EXTRACT(ISOYEAR FROM date)::int,
+            iso_week = EXTRACT(WEEK FROM date)::int
+        WHERE date IS NOT NULL
+          AND (iso_year IS NULL OR iso_week IS NULL)
+    """))
+
+
+def m002_indexes(conn):
+    """Indexy pre cudzie kľúče a filtre podľa týždňa – online (CONCURRENTLY)."""
+    create_index_concurrently(conn, "ix_records_iso_week", "records", ["iso_year", "iso_week"])
+    create_index_concurrently(conn, "ix_records_user_iso_week", "records", ["user_id", "iso_year", "iso_week"])
+    create_index_concurrently(conn, "ix_records_date", "records", ["date"])
+    create_index_concurrently(conn, "ix_records_project_date", "records", ["project_id", "date"])
+    create_index_concurrently(conn, "ix_crew_weeks_year_week", "crew_weeks", ["year", "week"])
+    create_index_concurrently(conn, "ix_crew_weeks_crew_id", "crew_weeks", ["crew_id"])
+    create_index_concurrently(conn, "ix_crew_week_members_crew_week_id", "crew_week_members", ["crew_week_id"])
+    create_index_concurrently(conn, "ix_crew_week_members_user_id", "crew_week_members", ["user_id"])
+    create_index_concurrently(conn, "ix_documents_user_id", "documents", ["user_id"])
+
+
+def m003_soft_delete(conn):
+    """deleted_at pre projekty a partie – mazanie na pozadí."""
+    conn.execute(text("ALTER TABLE projects ADD COLUMN IF NOT EXISTS deleted_at TIMESTAMP"))
+    conn.execute(text("ALTER TABLE crews ADD COLUMN IF NOT EXISTS deleted_at TIMESTAMP"))
+
+
+def m004_rollup_backfill(conn):
+    """Naplní record_rollups z histórie – create_all vytvorí len prázdnu tabuľku."""
+    # až tu: migrácie spúšťa upgrade.py, ktorý app už importoval
+    from sqlalchemy import delete
+    from app import RecordRollup, rollup_insert_statement
+
+    conn.execute(delete(RecordRollup))
+    conn.execute(rollup_insert_statement())
+
+
+ROLLUP_KEY_SQL = ("COALESCE(iso_year, 0), COALESCE(iso_week, 0), COALESCE(date, '0001-01-01'), "
+                  "COALESCE(user_id, 0), COALESCE(project_id, 0), COALESCE(unit_type, ''), COALESCE(m2_type, '')")
+
+
+def m005_rollup_unique_key(conn):
+    """Unikátny kľúč súhrnu – duplicity zo súbežných prepočtov najprv odstráni prepočet."""
+    # zápisy do súhrnu počkajú, kým index nestojí; čítanie ide ďalej
+    conn.execute(text("LOCK TABLE record_rollups IN EXCLUSIVE MODE"))
+    duplicate = conn.execute(text(
+        f"SELECT 1 FROM record_rollups GROUP BY {ROLLUP_KEY_SQL} HAVING COUNT(*) > 1 LIMIT 1"
+    )).first()
+    if duplicate:
+        print("⚠️ Súhrn obsahuje duplicitné riadky – prepočítavam ho z histórie.")
+        m004_rollup_backfill(conn)
+    conn.execute(text(f"CREATE UNIQUE INDEX IF NOT EXISTS ux_record_rollups_key ON record_rollups ({ROLLUP_KEY_SQL})"))
+
+
+MIGRATIONS = [
+    Migration(1, "records: unit_type, DATE, ISO týždeň", m001_records_columns, transactional=True),
+    Migration(2, "indexy (CONCURRENTLY)", m002_indexes, transactional=False),
+    Migration(3, "projects/crews: deleted_at", m003_soft_delete, transactional=True),
+    Migration(4, "record_rollups: naplnenie z histórie", m004_rollup_backfill, transactional=True),
+    Migration(5, "record_rollups: unikátny kľúč", m005_rollup_unique_key, transactional=True),
+]
+
+
+# ---------- SPÚŠŤANIE ----------
+
+def applied_versions(conn):
+    conn.execute(text("""
+        CREATE TABLE IF NOT EXISTS schema_migrations (
+            version INTEGER PRIMARY KEY,
+            name VARCHAR(200) NOT NULL,
+            applied_at TIMESTAMP NOT NULL DEFAULT now()
+        )
+    """))
+    return {v for (v,) in conn.execute(text("SELECT version FROM schema_migrations"))}
+
+
+def run_migrations(engine, migrations=MIGRATIONS):
+    """Spustí všetky ešte neaplikované migrácie v poradí verzií; vráti zoznam spustených."""
+    done = []
+    # spojenie so zámkom je v autocommit režime – advisory lock drží počas celého behu
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as lock_conn:
+        # stavba indexu trvá dlhšie ako bežný statement_timeout aplikácie
+        lock_conn.execute(text("SET statement_timeout = 0"))
+        lock_conn.execute(text("SELECT pg_advisory_lock(:id)"), {"id": MIGRATION_LOCK_ID})
+        try:
+            applied = applied_versions(lock_conn)
+            for migration in sorted(migrations, key=lambda m: m.version):
+                if migration.version in applied:
+                    continue
+                print(f"➡️ Migrácia {migration.version}: {migration.name}")
+                if migration.transactional:
+                    with engine.begin() as conn:
+                        conn.execute(text("SET LOCAL statement_timeout = 0"))
+                        migration.apply(conn)
+                        conn.execute(text("INSERT INTO schema_migrations (version, name) VALUES (:v, :n)"),
+                                     {"v": migration.version, "n": migration.name})
+                else:
+                    # bez transakcie – po páde sa migrácia zopakuje, kroky musia byť idempotentné
+                    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+                        conn.execute(text("SET statement_timeout = 0"))
+                        migration.apply(conn)
+                        conn.execute(text("INSERT INTO schema_migrations (version, name) VALUES (:v, :n)"),
+                                     {"v": migration.version, "n": migration.name})
+                done.append(migration.version)
+        finally:
+            lock_conn.execute(text("SELECT pg_advisory_unlock(:id)"), {"id": MIGRATION_LOCK_ID})
+    return done
@@ -0,0 +1,141 @@
+"""Vykresľovanie PDF reportov (ReportLab).
+
+Fonty sa registrujú a štýly sa vytvárajú raz na proces (worker), nie pri každej
+požiadavke. Štýly sú vlastné objekty modulu – zdieľaný getSampleStyleSheet()
+sa nikdy nemení.
+"""
+import io
+import os
+from collections import namedtuple
+from datetime import datetime
+from functools import lru_cache
+from xml.sax.saxutils import escape
+
+from reportlab.lib import colors
+from reportlab.lib.enums import TA_LEFT, TA_CENTER
+from reportlab.lib.pagesizes import landscape, A4
+from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfbase.ttfonts import TTFont
+from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
+
+from metrics import PDF_RENDER_SECONDS
+
+
+FONT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static", "fonts")
+
+# Jeden riadok tabuľky reportu – čisté dáta, bez ORM objektov
+ReportRow = namedtuple("ReportRow", "date user project address unit_type m2_type amount note")
+
+ReportStyles = namedtuple("ReportStyles", "normal header title")
+
+COLUMNS = ["Dátum", "Používateľ", "Projekt", "Adresa", "Operácia", "Hodiny", "m²", "Poznámka"]
+COL_WIDTHS = [70, 90, 120, 150, 90, 50, 40, 150]
+
+
+@lru_cache(maxsize=1)
+def get_fonts():
+    """Zaregistruje TTF fonty s diakritikou (raz na proces) a vráti (font, tučný font)."""
+    try:
+        pdfmetrics.registerFont(TTFont("FreeSans", os.path.join(FONT_DIR, "FreeSans.ttf")))
+        pdfmetrics.registerFont(TTFont("FreeSans-Bold", os.path.join(FONT_DIR, "FreeSansBold.ttf")))
+        return "FreeSans", "FreeSans-Bold"
+    except Exception:
+        return "Helvetica", "Helvetica-Bold"
+
+
+@lru_cache(maxsize=1)
+def get_styles():
+    """Predpripravené štýly odstavcov – nemeniť, zdieľajú sa medzi požiadavkami."""
+    font, font_bold = get_fonts()
+    sample = getSampleStyleSheet()
+
+    normal = ParagraphStyle(
+        "ReportNormal", parent=sample["Normal"],
+        fontName=font, fontSize=9, leading=11, alignment=TA_LEFT
+    )
+    header = ParagraphStyle(
+        "ReportHeader", parent=sample["Heading5"],
+        fontName=font_bold, fontSize=10, leading=12, alignment=TA_CENTER
+    )
+    title = ParagraphStyle(
+        "ReportTitle", parent=sample["Title"],
+        fontName=font_bold
+    )
+    return ReportStyles(normal=normal, header=header, title=title)
+
+
+def _operation(row):
+    if row.unit_type != "m2":
+        return "-"
+    if row.m2_type == "montaz":
+        return "Montáž"
+    if row.m2_type == "demontaz":
+        return "Demontáž"
+    return "-"
+
+
+def _records_table(rows):
+    font, _ = get_fonts()
+    styles = get_styles()
+    cell = lambda text: Paragraph(escape(text), styles.normal)
+
+    table_data = [[Paragraph(name, styles.header) for name in COLUMNS]]
+    for r in rows:
+        table_data.append([
+            cell(str(r.date)),
+            cell(r.user or "-"),
+            cell(r.project or "-"),
+            cell(r.address or "-"),
+            cell(_operation(r)),
+            cell(f"{r.amount:.2f}" if r.unit_type == "hodiny" else "-"),
+            cell(f"{r.amount:.2f}" if r.unit_type == "m2" else "-"),
+            cell(r.note or ""),
+        ])
+
+    table = Table(table_data, colWidths=COL_WIDTHS, repeatRows=1)
+    table.setStyle(TableStyle([
+        ('FONT', (0, 0), (-1, -1), font, 9),
+        ('GRID', (0, 0), (-1, -1), 0.3, colors.black),
+        ('ALIGN', (5, 1), (6, -1), 'RIGHT'),
+        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+        ('BACKGROUND', (0, 0), (-1, 0), colors.lightgrey),
+    ]))
+    return table
+
+
+def render_records_report(rows, title, info_lines=(), summary_lines=()):
+    """Vykreslí report so zoznamom záznamov a vráti PDF ako bytes.
+
+    info_lines a summary_lines sú riadky s ReportLab markupom (napr. <b>…</b>)
+    nad a pod tabuľkou.
+    """
+    with PDF_RENDER_SECONDS.time():
+        return _render_records_report(rows, title, info_lines, summary_lines)
+
+
+def _render_records_report(rows, title, info_lines, summary_lines):
+    styles = get_styles()
+    buffer = io.BytesIO()
+
+    doc = SimpleDocTemplate(
+        buffer,
+        pagesize=landscape(A4),
+        leftMargin=30,
+        rightMargin=30,
+        topMargin=40,
+        bottomMargin=30
+    )
+
+    story = [Paragraph(f"<b>{escape(title)}</b>", styles.title), Spacer(1, 12)]
+    story.extend(Paragraph(line, styles.normal) for line in info_lines)
+    story.append(Paragraph(f"Generované: {datetime.now().strftime('%d.%m.%Y %H:%M')}", styles.normal))
+    story.append(Spacer(1, 20))
+
+    story.append(_records_table(rows))
+    story.append(Spacer(1, 20))
+
+    story.extend(Paragraph(line, styles.normal) for line in summary_lines)
+
+    doc.build(story)
+    return buffer.getvalue()
@@ -0,0 +1,71 @@
+"""Profily jednotlivých požiadaviek (cProfile) uložené na disk.
+
+Admin pridá k ľubovoľnej URL parameter ?_profile=1; požiadavka sa odprofiluje
+a výsledok sa uloží ako .prof súbor. Zobraziť ho vie admin stránka
+(zoradené štatistiky) alebo sa stiahne a otvorí napr. v snakeviz
+(`snakeviz subor.prof`) ako flame graph.
+"""
+import io
+import os
+import pstats
+import re
+import time
+
+
+PROFILE_NAME_RE = re.compile(r"[0-9]{8}-[0-9]{9}-[0-9]+-[A-Za-z0-9_.]+\.prof")
+SORT_KEYS = ("cumulative", "tottime", "ncalls")
+
+
+class ProfileStore:
+    """Priečinok s .prof súbormi, drží najviac `keep` najnovších."""
+
+    def __init__(self, folder, keep=50):
+        self.folder = os.path.abspath(folder)
+        self.keep = keep
+        os.makedirs(self.folder, exist_ok=True)
+
+    def save(self, profiler, endpoint):
+        """Uloží profil požiadavky a vráti názov súboru."""
+        now = time.time()
+        stamp = time.strftime("%Y%m%d-%H%M%S", time.localtime(now)) + f"{int(now * 1000) % 1000:03d}"
+        name = f"{stamp}-{os.getpid()}-{re.sub(r'[^A-Za-z0-9_.]', '_', endpoint or 'unknown')}.prof"
+        profiler.dump_stats(os.path.join(self.folder, name))
+        self.cleanup()
+        return name
+
+    def path(self, name):
+        """Cesta k profilu, alebo None pre neplatný / neexistujúci názov."""
+        if not PROFILE_NAME_RE.fullmatch(name or ""):
+            return None
+        path = os.path.join(self.folder, name)
+        return path if os.path.exists(path) else None
+
+    def list(self):
+        """Profily od najnovšieho: [{name, size, mtime}]."""
+        entries = []
+        for name in os.listdir(self.folder):
+            if not PROFILE_NAME_RE.fullmatch(name):
+                continue
+            try:
+                st = os.stat(os.path.join(self.folder, name))
+            except OSError:
+                continue
+            entries.append({"name": name, "size": st.st_size, "mtime": st.st_mtime})
+        return sorted(entries, key=lambda e: e["mtime"], reverse=True)
+
+    def stats_text(self, name, sort="cumulative", limit=80):
+        """Textový výpis pstats zoradený podľa `sort` (prvých `limit` funkcií)."""
+        path = self.path(name)
+        if not path:
+            return None
+        out = io.StringIO()
+        stats = pstats.Stats(path, stream=out)
+        stats.strip_dirs().sort_stats(sort if sort in SORT_KEYS else "cumulative").print_stats(limit)
+        return out.getvalue()
+
+    def cleanup(self):
+        for entry in self.list()[self.keep:]:
+            try:
+                os.remove(os.path.join(self.folder, entry["name"]))
+            except OSError:
+                continue
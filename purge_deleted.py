@@ -0,0 +1,16 @@
+import sys
+
+from app import app, db, purge_deleted, Project, Crew
+
+print("🧹 Dokončujem mazanie zmazaných projektov a partií...")
+
+with app.app_context():
+    try:
+        purge_deleted()
+        left = (Project.query.filter(Project.deleted_at.isnot(None)).count()
+                + Crew.query.filter(Crew.deleted_at.isnot(None)).count())
+        print(f"✅ Hotovo, nedokončených mazaní: {left}")
+    except Exception as e:
+        db.session.rollback()
+        print(f"❌ Chyba pri mazaní: {e}")
+        sys.exit(1)  # release musí zlyhať
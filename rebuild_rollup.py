@@ -0,0 +1,12 @@
+from app import app, db, rebuild_rollup, RecordRollup
+
+print("🔄 Prepočítavam súhrnnú tabuľku record_rollups z histórie záznamov...")
+
+with app.app_context():
+    try:
+        rebuild_rollup()
+        db.session.commit()
+        print(f"✅ Hotovo, riadkov v súhrne: {RecordRollup.query.count()}")
+    except Exception as e:
+        db.session.rollback()
+        print(f"❌ Chyba pri prepočte súhrnu: {e}")
@@ -0,0 +1,155 @@
+"""Import historických záznamov z XLSX/CSV.
+
+Validácia beží nad celými stĺpcami (pandas), nie riadok po riadku – aj súbor
+so 100 000 riadkami sa skontroluje za pár sekúnd. Modul nepracuje s databázou,
+mená používateľov a projektov dostane ako slovníky názov → id.
+"""
+import io
+
+import pandas as pd
+
+
+# hlavičky, ktoré rozpoznáme (vrátane hlavičiek z nášho CSV/XLSX exportu)
+COLUMN_ALIASES = {
+    "date": "date", "dátum": "date", "datum": "date",
+    "user": "user", "používateľ": "user", "pouzivatel": "user", "meno": "user",
+    "project": "project", "projekt": "project",
+    "unit_type": "unit_type", "jednotka": "unit_type",
+    "amount": "amount", "množstvo": "amount", "mnozstvo": "amount",
+    "hodiny": "hours", "m²": "m2", "m2": "m2",
+    "m2_type": "m2_type", "operácia": "m2_type", "operacia": "m2_type", "typ práce": "m2_type",
+    "note": "note", "poznámka": "note", "poznamka": "note",
+    "address": "address", "adresa": "address",
+}
+
+UNIT_TYPES = {"hodiny": "hodiny", "h": "hodiny", "m2": "m2", "m²": "m2"}
+M2_TYPES = {"montaz": "montaz", "montáž": "montaz", "demontaz": "demontaz", "demontáž": "demontaz"}
+
+RECORD_COLUMNS = ["user_id", "project_id", "date", "iso_year", "iso_week",
+                  "amount", "unit_type", "m2_type", "note", "address"]
+
+
+def read_import_file(file_storage):
+    """Načíta nahratý súbor (.xlsx / .csv) do DataFrame s textovými stĺpcami."""
+    name = (file_storage.filename or "").lower()
+    if name.endswith(".xlsx"):
+        df = pd.read_excel(file_storage, dtype=object, engine="openpyxl")
+    elif name.endswith(".csv"):
+        # oddeľovač (, alebo ;) sa zistí automaticky; sniffer potrebuje text, nie bytes
+        text = io.TextIOWrapper(file_storage.stream, encoding="utf-8-sig")
+        df = pd.read_csv(text, dtype=str, sep=None, engine="python", skip_blank_lines=False)
+    else:
+        raise ValueError("Podporované sú len súbory .xlsx a .csv.")
+
+    df = df.rename(columns=lambda c: COLUMN_ALIASES.get(str(c).strip().lower(), str(c).strip()))
+    # index ostáva pôvodný – čísla riadkov v chybách sedia so súborom
+    return df.dropna(how="all")
+
+
+def _text(series):
+    return series.astype("string").str.strip().replace("", pd.NA)
+
+
+def _optional_text(df, col):
+    if col not in df.columns:
+        return pd.Series([None] * len(df), index=df.index, dtype=object)
+    values = _text(df[col])
+    return values.astype(object).where(values.notna(), None)
+
+
+def _name_map(names):
+    """názov → id pre jednoznačné názvy; viacnásobné názvy dostanú None."""
+    mapping = {}
+    for name, obj_id in names.items():
+        key = name.strip().lower()
+        mapping[key] = None if key in mapping else obj_id
+    return mapping
+
+
+def validate_import(df, users, projects):
+    """Skontroluje a prevedie importované riadky.
+
+    users, projects – {názov: id}. Vráti (records, errors): records je DataFrame
+    so stĺpcami RECORD_COLUMNS (len ak nie sú chyby), errors DataFrame
+    (row = číslo riadku v súbore, error = popis chýb).
+    """
+    missing = {"date", "user", "project"} - set(df.columns)
+    if "amount" not in df.columns and not {"hours", "m2"} & set(df.columns):
+        missing.add("amount")
+    if missing:
+        raise ValueError(f"V súbore chýbajú stĺpce: {', '.join(sorted(missing))}")
+
+    errors = pd.Series("", index=df.index, dtype="string")
+
+    def fail(mask, message):
+        mask = mask.fillna(False).astype(bool)
+        errors.loc[mask] = errors.loc[mask] + message + "; "
+
+    # --- dátum: RRRR-MM-DD, DD.MM.RRRR alebo dátum z Excelu ---
+    raw_date = df["date"]
+    dates = pd.to_datetime(raw_date, errors="coerce", format="ISO8601")
+    dates = dates.fillna(pd.to_datetime(raw_date, errors="coerce", format="%d.%m.%Y"))
+    fail(dates.isna(), "neplatný dátum")
+
+    # --- množstvo a jednotka (buď amount + unit_type, alebo stĺpce Hodiny / m² z exportu) ---
+    def number(col):
+        # vždy Float64 – stĺpec celých hodín by bol Int64 a fillna() desatinnými m² by zlyhalo
+        values = pd.to_numeric(_text(df[col]).str.replace(",", ".", regex=False), errors="coerce")
+        return values.astype("Float64")
+
+    if "amount" in df.columns:
+        amount = number("amount")
+        unit_type = _text(df.get("unit_type", pd.Series(pd.NA, index=df.index))).str.lower().map(UNIT_TYPES)
+    else:
+        hours = number("hours") if "hours" in df.columns else pd.Series(float("nan"), index=df.index)
+        m2 = number("m2") if "m2" in df.columns else pd.Series(float("nan"), index=df.index)
+        amount = hours.fillna(m2)
+        unit_type = pd.Series(pd.NA, index=df.index, dtype="object")
+        unit_type = unit_type.mask(m2.notna(), "m2").mask(hours.notna(), "hodiny")
+    fail(amount.isna(), "množstvo nie je číslo")
+    fail(unit_type.isna(), "neplatná jednotka (hodiny / m2)")
+
+    if "m2_type" in df.columns:
+        m2_raw = _text(df["m2_type"]).str.lower()
+        m2_type = m2_raw.map(M2_TYPES)
+        fail(m2_raw.notna() & (m2_raw != "-") & m2_type.isna(), "neplatný typ práce (montáž / demontáž)")
+    else:
+        m2_type = pd.Series(pd.NA, index=df.index, dtype="object")
+    m2_type = m2_type.where(unit_type == "m2")
+
+    # --- používateľ a projekt podľa názvu ---
+    user_names = _text(df["user"]).str.lower()
+    user_map = _name_map(users)
+    user_id = user_names.map(user_map)
+    fail(~user_names.isin(user_map.keys()), "neznámy používateľ")
+    fail(user_names.isin(user_map.keys()) & user_id.isna(), "meno používateľa nie je jednoznačné")
+
+    project_names = _text(df["project"]).str.lower()
+    project_map = _name_map(projects)
+    project_id = project_names.map(project_map)
+    fail(~project_names.isin(project_map.keys()), "neznámy projekt")
+    fail(project_names.isin(project_map.keys()) & project_id.isna(), "názov projektu nie je jednoznačný")
+
+    bad = errors != ""
+    error_report = pd.DataFrame({
+        "row": df.index[bad] + 2,  # +1 hlavička, +1 číslovanie od 1
+        "error": errors[bad].str.rstrip("; "),
+    })
+    if bad.any():
+        return None, error_report
+
+    iso = dates.dt.isocalendar()
+
+    records = pd.DataFrame({
+        "user_id": user_id.astype(int),
+        "project_id": project_id.astype(int),
+        "date": dates.dt.date,
+        "iso_year": iso["year"].astype(int),
+        "iso_week": iso["week"].astype(int),
+        "amount": amount.astype(float),
+        "unit_type": unit_type.astype(object),
+        "m2_type": m2_type.astype(object).where(m2_type.notna(), None),
+        "note": _optional_text(df, "note"),
+        "address": _optional_text(df, "address"),
+    }, columns=RECORD_COLUMNS)
+    return records, error_report
@@ -0,0 +1,34 @@
+"""Číselníky (projekty, používatelia, partie) v pamäti workeru.
+
+Zoznamy do roletiek sa menia zriedka, ale čítajú sa skoro na každej stránke.
+Každý worker si ich drží v pamäti. Platnosť stráži číslo verzie zo zdieľaného
+riadku v databáze: každý zápis do číselníkov ho v tej istej transakcii zvýši,
+takže po commite ostatné workery pri najbližšej požiadavke vidia novú verziu
+a dáta si znovu načítajú. TTL je len poistka pre zmeny mimo aplikácie
+(ručné SQL, skripty).
+"""
+import threading
+import time
+
+
+class ReferenceCache:
+    """Jedna sada dát platná pre danú verziu, najdlhšie `ttl` sekúnd."""
+
+    def __init__(self, ttl=300):
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._data = None
+        self._version = None
+        self._loaded_at = 0.0
+
+    def get(self, version, loader):
+        """Dáta pre `version` – z pamäte, alebo čerstvo z `loader()`."""
+        with self._lock:
+            if (self._data is not None and self._version == version
+                    and time.monotonic() - self._loaded_at < self.ttl):
+                return self._data
+
+        data = loader()
+        with self._lock:
+            self._data, self._version, self._loaded_at = data, version, time.monotonic()
+        return data
@@ -0,0 +1,81 @@
+"""Cache vykreslených PDF reportov na disku.
+
+Kľúč je SHA-256 z obsahu reportu (riadky, nadpis, súhrny) – teda z filtrov
+a z aktuálnych dát. Akákoľvek zmena záznamu alebo partie v rozsahu reportu
+zmení kľúč, takže starý súbor sa už nepoužije a časom ho vytlačí eviction
+podľa veľkosti. Kľúč slúži zároveň ako ETag.
+"""
+import hashlib
+import os
+import threading
+import time
+
+
+class ReportCache:
+    """PDF súbory pomenované hashom obsahu, s limitom celkovej veľkosti (LRU podľa mtime)."""
+
+    def __init__(self, folder, max_bytes=200 * 1024 * 1024):
+        self.folder = os.path.abspath(folder)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        os.makedirs(self.folder, exist_ok=True)
+
+    @staticmethod
+    def key(report):
+        """Hash obsahu reportu – argumentov pre render_records_report()."""
+        content = repr(sorted(report.items()))
+        return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+    def path(self, key):
+        return os.path.join(self.folder, f"{key}.pdf")
+
+    def get(self, key):
+        """Cesta k PDF v cache, alebo None. Zásah posunie súbor na koniec LRU."""
+        path = self.path(key)
+        try:
+            os.utime(path)
+        except OSError:
+            return None
+        return path
+
+    def put(self, key, pdf):
+        """Uloží PDF do cache a vráti cestu k nemu."""
+        path = self.path(key)
+        tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(pdf)
+        os.replace(tmp, path)
+        self.evict()
+        return path
+
+    def evict(self):
+        """Zmaže najdlhšie nepoužité PDF, kým cache nie je pod limitom veľkosti."""
+        with self._lock:
+            entries = []
+            total = 0
+            for name in os.listdir(self.folder):
+                if not name.endswith(".pdf"):
+                    continue
+                try:
+                    st = os.stat(os.path.join(self.folder, name))
+                except OSError:
+                    continue
+                entries.append((st.st_mtime, st.st_size, name))
+                total += st.st_size
+
+            if total <= self.max_bytes:
+                return
+
+            entries.sort()
+            now = time.time()
+            for mtime, size, name in entries:
+                if total <= self.max_bytes:
+                    break
+                # práve zapisovaný / stiahnutý súbor nechaj tak
+                if now - mtime < 1:
+                    continue
+                try:
+                    os.remove(os.path.join(self.folder, name))
+                    total -= size
+                except OSError:
+                    continue
@@ -0,0 +1,143 @@
+"""Záznam pomalých SQL dotazov aj s plánom vykonania (EXPLAIN).
+
+Dotaz, ktorý trvá dlhšie ako prah, sa zapíše ako jeden JSON riadok do
+rotujúceho logu: SQL, parametre, endpoint, trvanie a plán. Logy sú súbory
+(jeden na proces), takže admin stránka vidí pomalé dotazy zo všetkých
+gunicorn workerov.
+"""
+import glob
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+from logging.handlers import RotatingFileHandler
+
+
+EXPLAINABLE = ("select", "with", "insert", "update", "delete")
+MAX_PARAMS_CHARS = 1000
+
+
+def explain(dbapi_conn, dialect_name, statement, parameters):
+    """Plán dotazu ako text – vlastným DBAPI kurzorom, mimo udalostí SQLAlchemy.
+
+    Nový kurzor nenaruší výsledok pôvodného dotazu. Na Postgrese beží EXPLAIN
+    v savepointe, aby prípadná chyba nezrušila transakciu aplikácie.
+    """
+    if not statement.lstrip().lower().startswith(EXPLAINABLE):
+        return None
+
+    cursor = dbapi_conn.cursor()
+    try:
+        if dialect_name == "postgresql":
+            in_transaction = not getattr(dbapi_conn, "autocommit", False)
+            if in_transaction:
+                cursor.execute("SAVEPOINT slow_query_explain")
+            try:
+                cursor.execute("EXPLAIN (ANALYZE off) " + statement, parameters)
+                plan = "\n".join(row[0] for row in cursor.fetchall())
+            except Exception as e:
+                if in_transaction:
+                    cursor.execute("ROLLBACK TO SAVEPOINT slow_query_explain")
+                return f"EXPLAIN zlyhal: {e}"
+            if in_transaction:
+                cursor.execute("RELEASE SAVEPOINT slow_query_explain")
+            return plan
+
+        if dialect_name == "sqlite":
+            cursor.execute("EXPLAIN QUERY PLAN " + statement, parameters or ())
+            return "\n".join(str(row[-1]) for row in cursor.fetchall())
+        return None
+    except Exception as e:
+        return f"EXPLAIN zlyhal: {e}"
+    finally:
+        cursor.close()
+
+
+class SlowQueryLog:
+    """JSON log pomalých dotazov – každý proces píše do vlastného súboru.
+
+    Rotovať jeden súbor z viacerých gunicorn workerov nie je bezpečné (workery
+    by písali do premenovaného súboru), preto má každý proces svoj
+    slow_queries.<pid>.log s vlastnou rotáciou a recent() ich zlúči podľa času.
+    """
+
+    def __init__(self, path, threshold_ms=500, max_bytes=5 * 1024 * 1024, backup_count=3,
+                 max_age=7 * 24 * 3600):
+        self.path = os.path.abspath(path)
+        self.threshold = threshold_ms / 1000
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.max_age = max_age  # s – logy skončených workerov sa potom zmažú
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._handler = None
+        self._handler_pid = None
+
+    def _pattern(self, rotated=False):
+        base, ext = os.path.splitext(self.path)
+        return f"{glob.escape(base)}.*{ext}" + ("*" if rotated else "")
+
+    def _get_handler(self):
+        pid = os.getpid()
+        with self._lock:
+            if self._handler_pid != pid:
+                # po forku (gunicorn preload) patrí otvorený súbor rodičovi – otvoríme vlastný
+                self._cleanup()
+                base, ext = os.path.splitext(self.path)
+                self._handler = RotatingFileHandler(
+                    f"{base}.{pid}{ext}", maxBytes=self.max_bytes,
+                    backupCount=self.backup_count, encoding="utf-8",
+                )
+                self._handler_pid = pid
+            return self._handler
+
+    def _cleanup(self):
+        limit = time.time() - self.max_age
+        for path in glob.glob(self._pattern(rotated=True)):
+            try:
+                if os.path.getmtime(path) < limit:
+                    os.remove(path)
+            except OSError:
+                continue
+
+    @property
+    def enabled(self):
+        return self.threshold > 0
+
+    def is_slow(self, seconds):
+        return self.enabled and seconds >= self.threshold
+
+    def record(self, statement, parameters, seconds, endpoint=None, plan=None):
+        params = repr(parameters)
+        if len(params) > MAX_PARAMS_CHARS:
+            params = params[:MAX_PARAMS_CHARS] + "…"
+        line = json.dumps({
+            "time": time.time(),
+            "pid": os.getpid(),
+            "endpoint": endpoint,
+            "duration_ms": round(seconds * 1000, 1),
+            "sql": statement,
+            "params": params,
+            "plan": plan,
+        }, ensure_ascii=False)
+        self._get_handler().handle(logging.makeLogRecord({"msg": line}))
+
+    def recent(self, limit=100):
+        """Posledných `limit` záznamov (najnovšie prvé) zo všetkých procesov."""
+        entries = []
+        for path in glob.glob(self._pattern()):
+            try:
+                with open(path, encoding="utf-8") as f:
+                    lines = deque(f, maxlen=limit)
+            except OSError:
+                continue
+            for line in lines:
+                try:
+                    entries.append(json.loads(line))
+                except ValueError:
+                    continue
+        entries.sort(key=lambda e: e.get("time", 0), reverse=True)
+        return entries[:limit]
@@ -0,0 +1,44 @@
+// Exporty PDF na pozadí: odkaz s data-export-job spustí úlohu, stránka čaká
+// na jej dokončenie a potom stiahne súbor. Bez JS funguje bežný odkaz (href).
+document.addEventListener("DOMContentLoaded", () => {
+  const POLL_MS = 1500;
+  const MAX_WAIT_MS = 45 * 60 * 1000;  // fronta + vykreslenie; dlhšie nečakáme, aj keby server neodpovedal chybou
+
+  async function pollJob(statusUrl) {
+    const started = Date.now();
+    while (true) {
+      if (Date.now() - started > MAX_WAIT_MS) throw new Error("Export trvá príliš dlho, skús to znova.");
+      const res = await fetch(statusUrl, { credentials: "same-origin" });
+      const job = await res.json();
+      if (job.status === "done") return job;
+      if (job.status === "error" || !res.ok) throw new Error(job.error || "Export zlyhal.");
+      await new Promise(r => setTimeout(r, POLL_MS));
+    }
+  }
+
+  document.querySelectorAll("a[data-export-job]").forEach(link => {
+    link.addEventListener("click", async (event) => {
+      event.preventDefault();
+      if (link.classList.contains("disabled")) return;
+
+      const original = link.innerHTML;
+      link.classList.add("disabled");
+      link.innerHTML = '<span class="spinner-border spinner-border-sm me-1"></span> Generujem…';
+
+      try {
+        const query = link.href.includes("?") ? link.href.slice(link.href.indexOf("?")) : "";
+        const res = await fetch(link.dataset.exportJob + query, { method: "POST", credentials: "same-origin" });
+        const job = await res.json();
+        if (!res.ok) throw new Error(job.error || "Export sa nepodarilo spustiť.");
+
+        const done = await pollJob(job.status_url);
+        window.location = done.download_url;
+      } catch (err) {
+        alert("❌ " + err.message);
+      } finally {
+        link.classList.remove("disabled");
+        link.innerHTML = original;
+      }
+    });
+  });
+});
@@ -0,0 +1,33 @@
+// Stránkovanie záznamov: tlačidlo s data-load-more načíta ďalšiu stránku
+// (kurzor v data-cursor) a pripojí riadky do tabuľky v data-target.
+document.addEventListener("DOMContentLoaded", () => {
+  document.querySelectorAll("button[data-load-more]").forEach(button => {
+    button.addEventListener("click", async () => {
+      const target = document.querySelector(button.dataset.target);
+      const url = new URL(button.dataset.loadMore, window.location.origin);
+      url.searchParams.set("cursor", button.dataset.cursor);
+
+      const original = button.innerHTML;
+      button.disabled = true;
+      button.innerHTML = '<span class="spinner-border spinner-border-sm me-1"></span> Načítavam…';
+
+      try {
+        const res = await fetch(url, { credentials: "same-origin" });
+        const page = await res.json();
+        if (!res.ok) throw new Error(page.error || "Záznamy sa nepodarilo načítať.");
+
+        target.insertAdjacentHTML("beforeend", page.html);
+        if (page.next_cursor) {
+          button.dataset.cursor = page.next_cursor;
+        } else {
+          button.remove();
+        }
+      } catch (err) {
+        alert("❌ " + err.message);
+      } finally {
+        button.disabled = false;
+        button.innerHTML = original;
+      }
+    });
+  });
+});
@@ -0,0 +1,13 @@
+import os
+import sys
+import tempfile
+
+# app.py číta konfiguráciu pri importe – testy bežia nad dočasnou SQLite databázou
+_tmp = tempfile.mkdtemp(prefix="vykazy-tests-")
+os.environ["DATABASE_URL"] = "sqlite:///" + os.path.join(_tmp, "test.db")
+for name, folder in [("UPLOAD_FOLDER", "uploads"), ("EXPORT_FOLDER", "exports"),
+                     ("REPORT_CACHE_FOLDER", "report_cache"), ("PROFILE_FOLDER", "profiles")]:
+    os.environ[name] = os.path.join(_tmp, folder)
+os.environ["SLOW_QUERY_LOG"] = os.path.join(_tmp, "slow_queries.log")
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,61 @@
+"""Zmazanie používateľa musí nechať súhrn záznamov v súlade so záznamami."""
+from datetime import date
+
+import pytest
+
+import app as app_module
+from app import app, db, init_database, rebuild_rollup, User, Project, Record, RecordRollup
+from reference_cache import ReferenceCache
+
+
+def rollup_rows():
+    columns = [
+        RecordRollup.date, RecordRollup.user_id, RecordRollup.project_id, RecordRollup.unit_type,
+        RecordRollup.m2_type, RecordRollup.amount, RecordRollup.m2_unique, RecordRollup.m2_unique_user,
+        RecordRollup.record_count,
+    ]
+    return sorted(db.session.query(*columns).all(), key=repr)
+
+
+@pytest.fixture
+def admin_client(monkeypatch):
+    monkeypatch.setattr(app_module, "reference_cache", ReferenceCache())
+    with app.app_context():
+        db.drop_all()
+        init_database()
+        admin = User.query.filter_by(name="admin").one()
+        session_user = {"id": admin.id, "name": admin.name, "is_admin": True}
+
+    client = app.test_client()
+    with client.session_transaction() as sess:
+        sess["user"] = session_user
+    return client
+
+
+def test_delete_users_sharing_project_day(admin_client):
+    day = date(2024, 3, 4)
+    with app.app_context():
+        users = [User(name=f"user{i}", email=f"user{i}@example.com", password="x") for i in range(2)]
+        project = Project(name="Projekt")
+        db.session.add_all(users + [project])
+        db.session.flush()
+        for user, amount in zip(users, (12.5, 20)):
+            db.session.add(Record(user_id=user.id, project_id=project.id, date=day,
+                                  amount=amount, unit_type="m2", m2_type="montaz"))
+            db.session.add(Record(user_id=user.id, project_id=project.id, date=day,
+                                  amount=8, unit_type="hodiny"))
+        rebuild_rollup()
+        db.session.commit()
+        user_ids = [user.id for user in users]
+
+    for user_id in user_ids:
+        response = admin_client.post(f"/delete_user/{user_id}")
+        assert response.status_code == 302
+
+    with app.app_context():
+        assert User.query.filter(User.id.in_(user_ids)).count() == 0
+        assert Record.query.filter(Record.user_id.is_(None)).count() == 4
+        after_delete = rollup_rows()
+        rebuild_rollup()
+        assert after_delete == rollup_rows()
+        assert RecordRollup.query.filter(RecordRollup.user_id.is_(None)).count() == 2
@@ -0,0 +1,93 @@
+"""Počet SQL dotazov na stránku nesmie rásť s množstvom dát (N+1)."""
+from datetime import date, timedelta
+
+import pytest
+from sqlalchemy import event
+
+import app as app_module
+from app import app, db, init_database, rebuild_rollup, User, Project, Record, Crew, CrewWeek, CrewWeekMember
+from reference_cache import ReferenceCache
+
+
+# strop dotazov na požiadavku – platí pre N aj 2N záznamov
+QUERY_BOUNDS = {
+    "/dashboard": 7,
+    "/crews": 3,
+    "/api/dashboard/crews": 2,
+}
+
+
+def seed(scale):
+    """60×scale záznamov a 5×scale partií po 5 členov v aktuálnom týždni."""
+    year, week, _ = date.today().isocalendar()
+    monday = date.fromisocalendar(year, week, 1)
+
+    users = [User(name=f"user{i}", email=f"user{i}@example.com", password="x") for i in range(5 * scale)]
+    projects = [Project(name=f"Projekt {i}") for i in range(3 * scale)]
+    db.session.add_all(users + projects)
+    db.session.flush()
+
+    for i in range(60 * scale):
+        unit_type = "m2" if i % 3 == 0 else "hodiny"
+        db.session.add(Record(
+            user_id=users[i % len(users)].id,
+            project_id=projects[i % len(projects)].id,
+            date=monday + timedelta(days=i % 5),
+            amount=8,
+            unit_type=unit_type,
+            m2_type="montaz" if unit_type == "m2" else None,
+        ))
+
+    for i in range(5 * scale):
+        crew = Crew(name=f"Partia {i}")
+        db.session.add(crew)
+        db.session.flush()
+        crew_week = CrewWeek(crew_id=crew.id, year=year, week=week, project_id=projects[i % len(projects)].id)
+        db.session.add(crew_week)
+        db.session.flush()
+        for user in users[:5]:
+            db.session.add(CrewWeekMember(crew_week_id=crew_week.id, user_id=user.id))
+
+    rebuild_rollup()
+    db.session.commit()
+
+
+@pytest.fixture(params=[1, 2], ids=["N", "2N"])
+def admin_client(request, monkeypatch):
+    # čistá databáza aj cache číselníkov pre každú veľkosť dát
+    monkeypatch.setattr(app_module, "reference_cache", ReferenceCache())
+    with app.app_context():
+        db.drop_all()
+        init_database()
+        seed(request.param)
+        admin = User.query.filter_by(name="admin").one()
+        session_user = {"id": admin.id, "name": admin.name, "is_admin": True}
+
+    client = app.test_client()
+    with client.session_transaction() as sess:
+        sess["user"] = session_user
+    return client
+
+
+def count_queries(client, url):
+    with app.app_context():
+        engine = db.engine
+    queries = []
+
+    def listener(conn, cursor, statement, *args):
+        queries.append(statement)
+
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        response = client.get(url)
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+    assert response.status_code == 200
+    return len(queries)
+
+
+@pytest.mark.parametrize("url", list(QUERY_BOUNDS))
+def test_query_count_is_bounded(admin_client, url):
+    client = admin_client
+    client.get(url)  # prvé načítanie naplní cache číselníkov
+    assert count_queries(client, url) <= QUERY_BOUNDS[url]
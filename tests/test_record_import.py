@@ -0,0 +1,41 @@
+"""Import záznamov musí prijať aj súbor z nášho exportu (stĺpce Hodiny / m²)."""
+import io
+
+import pandas as pd
+import pytest
+from werkzeug.datastructures import FileStorage
+
+from record_import import read_import_file, validate_import
+
+
+USERS = {"Jano": 1}
+PROJECTS = {"Projekt A": 10}
+
+EXPORT_ROWS = pd.DataFrame({
+    "Dátum": ["2024-03-04", "2024-03-04", "05.03.2024"],
+    "Používateľ": ["Jano", "Jano", "Jano"],
+    "Projekt": ["Projekt A", "Projekt A", "Projekt A"],
+    "Hodiny": [8, None, 6],
+    "m²": [None, 12.5, None],
+    "Operácia": ["-", "Montáž", "-"],
+})
+
+
+def upload(df, fmt):
+    buffer = io.BytesIO()
+    if fmt == "csv":
+        buffer.write(df.to_csv(index=False).encode("utf-8"))
+    else:
+        df.to_excel(buffer, index=False, engine="openpyxl")
+    buffer.seek(0)
+    return FileStorage(stream=buffer, filename=f"export.{fmt}")
+
+
+@pytest.mark.parametrize("fmt", ["csv", "xlsx"])
+def test_mixed_hours_and_m2_columns(fmt):
+    records, errors = validate_import(read_import_file(upload(EXPORT_ROWS, fmt)), USERS, PROJECTS)
+
+    assert errors.empty
+    assert records["amount"].tolist() == [8.0, 12.5, 6.0]
+    assert records["unit_type"].tolist() == ["hodiny", "m2", "hodiny"]
+    assert records["m2_type"].tolist() == [None, "montaz", None]
@@ -1,25 +1,17 @@
+import sys
+
 from app import app, db
-from sqlalchemy import text
+from migrations import run_migrations
 
-print("🚀 Upravujem databázu podľa nových modelov...")
+print("🚀 Spúšťam migrácie databázy...")
 
 with app.app_context():
     try:
-        with db.engine.connect() as conn:
-            # 1️⃣ Pridať unit_type do records
-            conn.execute(text("""
-                ALTER TABLE records ADD COLUMN IF NOT EXISTS unit_type VARCHAR(10);
-            """))
-
-            # 2️⃣ Odstrániť unit_type z projects (ak existuje)
-            try:
-                conn.execute(text("""
-                    ALTER TABLE projects DROP COLUMN IF EXISTS unit_type;
-                """))
-            except Exception as e:
-                print(f"⚠️ Nepodarilo sa odstrániť projects.unit_type: {e}")
-
-            conn.commit()
-        print("✅ Úpravy databázy dokončené.")
+        done = run_migrations(db.engine)
+        if done:
+            print(f"✅ Aplikované migrácie: {', '.join(map(str, done))}")
+        else:
+            print("ℹ️ Databáza je aktuálna, nie je čo migrovať.")
     except Exception as e:
-        print(f"❌ Chyba počas úpravy: {e}")
+        print(f"❌ Chyba počas migrácie: {e}")
+        sys.exit(1)  # release musí zlyhať – inak web štartuje nad starou schémou